@@ -9,10 +9,39 @@ Analyzes job descriptions to extract:
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Set
 
 from database.repositories import CacheRepository
 
+# Patterns like "3+ years", "5-7 years", etc.
+_EXPERIENCE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"(\d+)\+?\s*years?\s+(?:of\s+)?experience",
+        r"(\d+)-(\d+)\s*years?\s+(?:of\s+)?experience",
+        r"minimum\s+(?:of\s+)?(\d+)\s*years?",
+    )
+)
+
+# Common section headers
+_SECTION_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for name, pattern in {
+        "responsibilities": r"(?:responsibilities|duties|role)[:\s]*([^\n]+(?:\n(?!\n)[^\n]+)*)",
+        "requirements": r"(?:requirements|qualifications)[:\s]*([^\n]+(?:\n(?!\n)[^\n]+)*)",
+        "nice_to_have": r"(?:nice to have|preferred|bonus)[:\s]*([^\n]+(?:\n(?!\n)[^\n]+)*)",
+    }.items()
+}
+
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """Compiled word-boundary pattern for a skill keyword, built once per process"""
+    return re.compile(r"\b" + re.escape(keyword) + r"\b")
+
 
 class JobAnalyzer:
     def __init__(self):
@@ -132,8 +161,7 @@ class JobAnalyzer:
             found = []
             for keyword in keywords:
                 # Use word boundaries to avoid partial matches
-                pattern = r"\b" + re.escape(keyword) + r"\b"
-                if re.search(pattern, job_desc_lower):
+                if _keyword_pattern(keyword).search(job_desc_lower):
                     found.append(keyword)
             if found:
                 found_skills[category] = found
@@ -142,15 +170,8 @@ class JobAnalyzer:
 
     def _extract_experience(self, job_desc_lower: str) -> str:
         """Extract experience requirements"""
-        # Look for patterns like "3+ years", "5-7 years", etc.
-        patterns = [
-            r"(\d+)\+?\s*years?\s+(?:of\s+)?experience",
-            r"(\d+)-(\d+)\s*years?\s+(?:of\s+)?experience",
-            r"minimum\s+(?:of\s+)?(\d+)\s*years?",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, job_desc_lower)
+        for pattern in _EXPERIENCE_PATTERNS:
+            match = pattern.search(job_desc_lower)
             if match:
                 return match.group(0)
 
@@ -174,15 +195,8 @@ class JobAnalyzer:
         """Identify different sections in the job description"""
         sections = {}
 
-        # Common section headers
-        section_patterns = {
-            "responsibilities": r"(?:responsibilities|duties|role)[:\s]*([^\n]+(?:\n(?!\n)[^\n]+)*)",
-            "requirements": r"(?:requirements|qualifications)[:\s]*([^\n]+(?:\n(?!\n)[^\n]+)*)",
-            "nice_to_have": r"(?:nice to have|preferred|bonus)[:\s]*([^\n]+(?:\n(?!\n)[^\n]+)*)",
-        }
-
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, job_description, re.IGNORECASE | re.MULTILINE)
+        for section_name, pattern in _SECTION_PATTERNS.items():
+            match = pattern.search(job_description)
             if match:
                 sections[section_name] = match.group(1).strip()
 
@@ -232,7 +246,7 @@ class JobAnalyzer:
         }
 
         # Extract words
-        words = re.findall(r"\b[a-z]{3,}\b", job_desc_lower)
+        words = _WORD_RE.findall(job_desc_lower)
 
         # Filter and count
         word_freq = {}
@@ -358,20 +358,12 @@ def generate_resume():
         # LinkedIn Data Handling (File Export or URL)
         if linkedin_file and linkedin_file.filename:
             logger.debug(f"[{rid}] Processing LinkedIn file")
-            # Save file temporarily
-            upload_dir = "uploads"
-            os.makedirs(upload_dir, exist_ok=True)
-            temp_filename = f"{uuid.uuid4()}_{linkedin_file.filename}"
-            file_path = os.path.join(upload_dir, temp_filename)
-            linkedin_file.save(file_path)
-
-            linkedin_data = linkedin_scraper.parse_export(file_path)
+            # Parse the upload in place; no temporary copy on disk
+            linkedin_data = linkedin_scraper.parse_export(
+                linkedin_file.stream, fields=ResumeGenerator.LINKEDIN_FIELDS
+            )
             profile_data["linkedin"] = linkedin_data
 
-            # Cleanup
-            if os.path.exists(file_path):
-                os.remove(file_path)
-
         # Step 2: Analyze job description
         logger.debug(f"[{rid}] Analyzing job description")
         job_requirements = job_analyzer.analyze(job_description)
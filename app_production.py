@@ -454,22 +454,14 @@ def generate_resume():
         if linkedin_file and linkedin_file.filename:
             try:
                 logger.debug(f"[{rid}] Parsing LinkedIn data export")
-                # Save file temporarily using absolute path
-                temp_filename = f"{uuid.uuid4()}_{linkedin_file.filename}"
-                abs_upload_dir = os.path.join(BASE_DIR, config.UPLOAD_DIR)
-                file_path = os.path.join(abs_upload_dir, temp_filename)
-                os.makedirs(abs_upload_dir, exist_ok=True)
-                linkedin_file.save(file_path)
-
-                linkedin_data = linkedin_scraper.parse_export(file_path)
+                # Parse the upload in place; no temporary copy on disk
+                linkedin_data = linkedin_scraper.parse_export(
+                    linkedin_file.stream, fields=ResumeGenerator.LINKEDIN_FIELDS
+                )
                 profile_data["linkedin"] = linkedin_data
                 logger.debug(
                     f"[{rid}] LinkedIn export parsed successfully"
                 )
-
-                # Cleanup
-                if os.path.exists(file_path):
-                    os.remove(file_path)
             except Exception as e:
                 logger.warning(
                     f"[{rid}] LinkedIn export parsing failed: {e}"
@@ -5,6 +5,7 @@ Supports environment-specific configs with validation and sensible defaults.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from enum import Enum
 from typing import Dict, Any, Optional
@@ -57,6 +58,7 @@ class Config:
     # Caching
     CACHE_ENABLED = True
     CACHE_TTL_GITHUB = 3600  # 1 hour
+    CACHE_TTL_GITHUB_NOT_FOUND = 300  # 5 minutes
     CACHE_TTL_ANALYSIS = 7200  # 2 hours
     CACHE_TTL_RESUME = 86400  # 24 hours
     REDIS_URL = "redis://localhost:6379/0"
@@ -69,11 +71,13 @@ class Config:
     # GitHub Scraper
     GITHUB_MAX_REPOS = 20
     GITHUB_MAX_TOP_PROJECTS = 3
+    GITHUB_POOL_SIZE = 20  # Keep-alive connections shared by concurrent scrapes
 
     # Gemini
     GEMINI_MODEL = "gemini-2.0-flash-lite"
     GEMINI_MAX_TOKENS = 2000
     GEMINI_TEMPERATURE = 0.7
+    GEMINI_PROMPT_TOKEN_BUDGET = 8000  # Lower-priority sections are dropped above this
 
     # ElevenLabs Conversational AI
     ELEVENLABS_AGENT_ID = None
@@ -217,8 +221,12 @@ class TestingConfig(Config):
 
 def get_config() -> Config:
     """Get configuration for current environment"""
-    env = os.getenv("ENVIRONMENT", "development").lower()
+    return _load_config(os.getenv("ENVIRONMENT", "development").lower())
 
+
+@lru_cache(maxsize=None)
+def _load_config(env: str) -> Config:
+    """Load the config class for an environment once per process"""
     config_map = {
         "development": DevelopmentConfig,
         "staging": StagingConfig,
@@ -8,6 +8,7 @@ from .mongodb import (
     APIKey,
     JobCache,
     GitHubProfileCache,
+    ResumeCache,
     AuditLog,
     ResumeVersion,
     init_db,
@@ -22,6 +23,7 @@ __all__ = [
     "APIKey",
     "JobCache",
     "GitHubProfileCache",
+    "ResumeCache",
     "AuditLog",
     "ResumeVersion",
     "init_db",
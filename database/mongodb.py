@@ -301,6 +301,22 @@ class GitHubProfileCache(Document):
     }
 
 
+class ResumeCache(Document):
+    """Cache for generated resume content, keyed by a hash of its inputs"""
+
+    content_hash = StringField(required=True, unique=True, index=True)
+    resume_content = DictField(required=True)
+    created_at = DateTimeField(default=datetime.utcnow)
+    expires_at = DateTimeField(required=True)  # TTL
+
+    meta = {
+        "collection": "resume_cache",
+        "indexes": [
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+        ],
+    }
+
+
 class AuditLog(Document):
     """Audit log for tracking operations"""
 
@@ -339,6 +355,7 @@ def init_db():
         APIKey.ensure_indexes()
         JobCache.ensure_indexes()
         GitHubProfileCache.ensure_indexes()
+        ResumeCache.ensure_indexes()
         AuditLog.ensure_indexes()
 
         logger.info("Database initialization completed successfully")
@@ -15,6 +15,7 @@ from database import (
     APIKey,
     JobCache,
     GitHubProfileCache,
+    ResumeCache,
     AuditLog,
 )
 
@@ -244,7 +245,7 @@ class CacheRepository:
 
     @staticmethod
     def cache_github_profile(
-        username: str, profile_data: Dict, ttl_hours: int = 1
+        username: str, profile_data: Dict, ttl_hours: float = 1
     ) -> GitHubProfileCache:
         """Cache GitHub profile"""
         # Check if already cached
@@ -276,6 +277,43 @@ class CacheRepository:
         logger.debug(f"GitHub profile cache miss: {username}")
         return None
 
+    @staticmethod
+    def cache_resume(
+        content_hash: str, resume_content: Dict, ttl_hours: int = 24
+    ) -> ResumeCache:
+        """Cache generated resume content"""
+        # Check if already cached
+        existing = ResumeCache.objects(content_hash=content_hash).first()
+        if existing:
+            existing.delete()
+
+        # Create new cache
+        expires_at = datetime.utcnow() + timedelta(hours=ttl_hours)
+        cache = ResumeCache(
+            content_hash=content_hash,
+            resume_content=resume_content,
+            expires_at=expires_at,
+        )
+        cache.save()
+        logger.debug(f"Resume cached with hash: {content_hash}")
+        return cache
+
+    @staticmethod
+    def get_cached_resume(content_hash: str) -> Optional[Dict]:
+        """Get cached resume content"""
+        cache = ResumeCache.objects(
+            content_hash=content_hash,
+            expires_at__gt=datetime.utcnow(),  # Not expired
+        ).first()
+
+        if cache:
+            logger.debug(f"Resume cache hit")
+            # Convert to plain dict to avoid ReferenceError when modified
+            return dict(cache.resume_content)
+
+        logger.debug(f"Resume cache miss")
+        return None
+
 
 class AuditLogRepository:
     """Repository for audit log operations"""
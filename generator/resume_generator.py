@@ -7,13 +7,235 @@ then generates tailored resume content.
 
 from google import genai
 import os
+import re
 import json
-from typing import Dict, List
+import hashlib
+from functools import lru_cache
+from string import Template
+from typing import Dict, List, Optional
+from config import get_logger
 from config.config import get_config
-from database.repositories import ResumeRepository
+from database.repositories import CacheRepository, ResumeRepository
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+logger = get_logger(__name__)
+
+if orjson is not None:
+
+    def _json_dumps_indented(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _json_dumps_canonical(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+
+    _json_loads = orjson.loads
+
+else:  # pragma: no cover
+
+    def _json_dumps_indented(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _json_dumps_canonical(obj) -> bytes:
+        return json.dumps(
+            obj, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+
+    _json_loads = json.loads
+
+# Profile fields that change often but never reach the prompt
+_VOLATILE_FIELDS = frozenset({"followers", "following", "updated_at", "public_repos"})
+
+# Free-text fields whose whitespace is irrelevant to the generated resume
+_TEXT_FIELDS = frozenset({"bio", "summary", "headline", "original_description"})
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Markdown code fences Gemini sometimes wraps its JSON in
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Rough size of a Gemini token; good enough to budget prompts without an
+# extra count_tokens round trip
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def _canonicalize(data):
+    """
+    Normalize resume inputs so logically-equivalent data hashes identically
+
+    Drops volatile counters, collapses whitespace in free-text fields and
+    sorts the order-insensitive skill/language lists. Key order is handled
+    by serializing with sorted keys.
+    """
+    if isinstance(data, dict):
+        canonical = {}
+        for key, value in data.items():
+            if key in _VOLATILE_FIELDS:
+                continue
+            if key == "full_data":
+                # Lazily parsed export sheets; hash their raw bytes instead of
+                # parsing every one
+                value = value.digest() if value else None
+            elif key in _TEXT_FIELDS and isinstance(value, str):
+                value = _WHITESPACE_RE.sub(" ", value).strip()
+            elif key in ("languages", "skills") and isinstance(value, list):
+                value = sorted(_canonicalize(v) for v in value)
+            elif key == "skills" and isinstance(value, dict):
+                # Job requirements: {category: [skill, ...]}
+                value = {k: sorted(v) for k, v in value.items()}
+            else:
+                value = _canonicalize(value)
+            canonical[key] = value
+        return canonical
+    if isinstance(data, (list, tuple)):
+        return [_canonicalize(v) for v in data]
+    return data
+
+
+def _resume_cache_key(
+    profile_data: Dict, job_requirements: Dict, model_name: str
+) -> str:
+    """Content hash of the generator inputs, used as the resume cache key"""
+    canonical = {
+        "model": model_name,
+        "prompt": _PROMPT_VERSION,
+        "profile": _canonicalize(profile_data),
+        "job": _canonicalize(job_requirements),
+    }
+    payload = _json_dumps_canonical(canonical)
+    return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+
+def _extract_json_object(response_text: str):
+    """
+    Decode the first JSON value in a model response
+
+    Strips markdown fences, then decodes from the first '{'. If anything
+    trails the JSON (commentary, a second block), raw_decode stops at the
+    end of the first complete value, so braces inside string values or in
+    the trailing text can't mis-terminate it.
+    """
+    text = _CODE_FENCE_RE.sub("", response_text.strip())
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    try:
+        return _json_loads(text[start:])
+    except ValueError:
+        parsed, _ = _JSON_DECODER.raw_decode(text, start)
+        return parsed
+
+
+# Part of the resume cache key; bump whenever _PROMPT_TEMPLATE or what
+# _create_prompt feeds into it changes, so stale resumes aren't served
+_PROMPT_VERSION = 1
+
+# Static prompt skeleton, parsed once at import; only the fields vary per call
+_PROMPT_TEMPLATE = Template(
+    """You are an expert resume writer. Create a tailored resume based on the following information:
+
+JOB DESCRIPTION:
+$job_description
+
+CANDIDATE INFORMATION:
+Name: $name
+Headline: $headline
+Bio: $bio
+Summary: $summary
+Location: $location
+Email: $email
+
+PROFESSIONAL EXPERIENCE:
+$experience
+
+EDUCATION:
+$education
+
+TECHNICAL SKILLS:
+$skills
+
+GITHUB PROJECTS:
+$github_projects
+
+LINKEDIN PROJECTS:
+$linkedin_projects
+
+ADDITIONAL PROFESSIONAL DETAILS (from LinkedIn Archive):
+$additional_info
+
+REQUIRED SKILLS FROM JOB:
+$required_skills
+
+TASK:
+Generate a detailed, tailored resume that MUST fit on a single page. Follow these guidelines:
+1. Highlights relevant skills that match the job requirements.
+2. Incorporates both professional experience from LinkedIn and technical projects from GitHub.
+3. PRIORITIZE professional experience over projects. If space is limited, include more work experience items and fewer project items.
+4. Uses strong action words and quantifiable achievements (e.g., "Increased efficiency by 20%", "Managed a team of 5").
+5. Provide a concise professional summary (max 2-3 sentences) that highlights your unique value proposition.
+6. Provide exactly 2-3 concise bullet points for each work experience.
+7. Provide exactly 1-2 concise bullet points for each project.
+8. Ensure the layout is dense and professional to avoid empty space while strictly remaining on one page.
+9. Include a maximum of 3 professional work experiences and a maximum of 3 projects.
+
+Return the response in the following JSON format:
+{
+    "summary": "Professional summary (2-3 sentences)",
+    "skills": ["skill1", "skill2", "skill3"],
+    "education": [
+        {
+            "degree": "Degree Name",
+            "school": "School Name",
+            "date": "Graduation Date",
+            "details": "Minor or relevant coursework"
+        }
+    ],
+    "experience": [
+        {
+            "role": "Job Title",
+            "company": "Company Name",
+            "date": "Start - End",
+            "description": "Tailored bullet point highlighting relevance"
+        }
+    ],
+    "projects": [
+        {
+            "name": "Project Name",
+            "description": "Tailored description emphasizing project impact",
+            "technologies": ["tech1", "tech2"]
+        }
+    ],
+    "certifications": ["Cert 1", "Cert 2"]
+}
+
+Only return valid JSON, no additional text."""
+)
+
+
+@lru_cache(maxsize=None)
+def _get_gemini_client(api_key: str) -> genai.Client:
+    """Shared Gemini client per API key, so its HTTP connections are reused"""
+    return genai.Client(api_key=api_key)
 
 
 class ResumeGenerator:
+    # LinkedIn export fields read by the prompt and the basic resume, for
+    # LinkedInScraper.parse_export(fields=...); other sections are used whole
+    LINKEDIN_FIELDS = {
+        "experience": ("title", "company", "start_date", "end_date", "description"),
+        "projects": ("title", "description", "start_date", "end_date"),
+    }
+
     def __init__(self):
         """Initialize resume generator with Gemini API"""
         self.config = get_config()
@@ -24,10 +246,10 @@ class ResumeGenerator:
         else:
             # Using the model specified in configuration (cheapest: gemini-2.0-flash-lite)
             try:
-                self.client = genai.Client(api_key=api_key)
+                self.client = _get_gemini_client(api_key)
                 self.model_name = self.config.GEMINI_MODEL
             except Exception:
-                self.client = genai.Client(api_key=api_key)
+                self.client = _get_gemini_client(api_key)
                 self.model_name = "gemini-2.0-flash"
 
     def generate(self, profile_data: Dict, job_requirements: Dict, user_id: str = None) -> Dict:
@@ -42,10 +264,27 @@ class ResumeGenerator:
         Returns:
             Dictionary containing structured resume content
         """
+        if not job_requirements or not job_requirements.get("original_description"):
+            # Nothing to tailor against; a Gemini call would only burn tokens
+            logger.debug("No job description provided, generating basic resume")
+            return self._generate_basic_resume(profile_data, job_requirements or {})
+
         if not self.client:
             # Fallback without AI
             return self._generate_basic_resume(profile_data, job_requirements)
 
+        cache_key = None
+        if self.config.CACHE_ENABLED:
+            try:
+                cache_key = _resume_cache_key(
+                    profile_data, job_requirements, self.model_name
+                )
+                cached = CacheRepository.get_cached_resume(cache_key)
+                if cached:
+                    return cached
+            except Exception as e:
+                logger.warning(f"Failed to read resume cache: {e}")
+
         try:
             # Prepare prompt for Gemini
             prompt = self._create_prompt(profile_data, job_requirements)
@@ -57,12 +296,27 @@ class ResumeGenerator:
             )
 
             # Parse the response
-            return self._parse_gemini_response(response.text, profile_data)
+            resume_content = self._parse_gemini_response(response.text, profile_data)
 
         except Exception as e:
             print(f"Error generating resume with Gemini: {e}")
+            resume_content = None
+
+        if resume_content is None:
             return self._generate_basic_resume(profile_data, job_requirements)
 
+        if cache_key:
+            try:
+                CacheRepository.cache_resume(
+                    cache_key,
+                    resume_content,
+                    ttl_hours=self.config.CACHE_TTL_RESUME // 3600,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache resume: {e}")
+
+        return resume_content
+
     def _store_resume(self, resume_content: Dict, profile_data: Dict, job_requirements: Dict, user_id: str = None) -> None:
         """Helper to store resume in database"""
         if not user_id:
@@ -94,131 +348,113 @@ class ResumeGenerator:
         linkedin_skills = linkedin_data.get("skills", [])
         all_candidate_skills = list(set(github_languages + linkedin_skills))
 
-        # Format LinkedIn Experience
-        experience_text = ""
-        for exp in linkedin_data.get("experience", [])[:5]: # Limit input to 5 best matches
-            experience_text += f"- {exp.get('title')} at {exp.get('company')} ({exp.get('start_date')} - {exp.get('end_date')}): {exp.get('description')}\n"
+        # Format LinkedIn Experience (limit input to 5 best matches)
+        experiences = linkedin_data.get("experience", [])
+        experience_text = self._format_experience(experiences[:5])
 
         # Format Education
-        education_text = ""
+        education_lines = []
         for edu in linkedin_data.get("education", [])[:2]:
             degree = edu.get("degree") or "Degree"
             field = edu.get("field_of_study") or edu.get("notes")
             school = edu.get("school") or "University"
             dates = f"{edu.get('start_date', '')} - {edu.get('end_date', '')}"
+            field_text = f" in {field}" if field else ""
 
-            education_text += f"- {degree}"
-            if field:
-                education_text += f" in {field}"
-            education_text += f" from {school} ({dates})\n"
+            education_lines.append(f"- {degree}{field_text} from {school} ({dates})\n")
+        education_text = "".join(education_lines)
 
         # Format LinkedIn Projects (if available)
-        linkedin_projects = linkedin_data.get("projects", [])[:3]
-        li_projects_text = ""
-        for lp in linkedin_projects:
-            li_projects_text += f"- {lp.get('title')}: {lp.get('description')} ({lp.get('start_date')} - {lp.get('end_date')})\n"
+        linkedin_projects = linkedin_data.get("projects", [])
+        li_projects_text = self._format_linkedin_projects(linkedin_projects[:3])
 
         # Format Other LinkedIn Data
-        additional_info = ""
-        full_data = linkedin_data.get("full_data", {})
-        for category, items in full_data.items():
-            if category in [
-                "profile",
-                "positions",
-                "education",
-                "skills",
-                "projects",
-                "connections",
-            ]:
+        additional_parts = []
+        other_sections = {
+            "certifications": linkedin_data.get("certifications", []),
+            "languages": linkedin_data.get("languages", []),
+            "honors": linkedin_data.get("awards", []),
+        }
+        # Limit to 10 items per category to avoid token bloat; lazily parsed
+        # export sheets are only read that far
+        full_data = linkedin_data.get("full_data")
+        for category in full_data or ():
+            if category == "connections":
                 continue
+            other_sections[category] = full_data.head(category, 10)
+        for category, items in other_sections.items():
             if items:
-                additional_info += f"\n{category.upper()}:\n"
-                for item in items[
-                    :10
-                ]:  # Limit to 10 items per category to avoid token bloat
-                    # Clean up dictionary to string
-                    item_str = ", ".join(
-                        [f"{k}: {v}" for k, v in item.items() if v])
-                    additional_info += f"- {item_str}\n"
-
-        prompt = f"""You are an expert resume writer. Create a tailored resume based on the following information:
-
-JOB DESCRIPTION:
-{job_requirements.get('original_description', 'N/A')}
-
-CANDIDATE INFORMATION:
-Name: {linkedin_data.get('name') or github_data.get('name', 'N/A')}
-Headline: {linkedin_data.get('headline', 'N/A')}
-Bio: {github_data.get('bio', 'N/A')}
-Summary: {linkedin_data.get('summary', 'N/A')}
-Location: {linkedin_data.get('location') or github_data.get('location', 'N/A')}
-Email: {github_data.get('email', 'N/A')}
-
-PROFESSIONAL EXPERIENCE:
-{experience_text or 'N/A'}
-
-EDUCATION:
-{education_text or 'N/A'}
-
-TECHNICAL SKILLS:
-{', '.join(all_candidate_skills)}
-
-GITHUB PROJECTS:
-{self._format_projects(github_data.get('top_projects', []))}
-
-LINKEDIN PROJECTS:
-{li_projects_text or 'N/A'}
-
-ADDITIONAL PROFESSIONAL DETAILS (from LinkedIn Archive):
-{additional_info or 'N/A'}
-
-REQUIRED SKILLS FROM JOB:
-{json.dumps(job_requirements.get('skills', {}), indent=2)}
-
-TASK:
-Generate a detailed, tailored resume that MUST fit on a single page. Follow these guidelines:
-1. Highlights relevant skills that match the job requirements.
-2. Incorporates both professional experience from LinkedIn and technical projects from GitHub.
-3. PRIORITIZE professional experience over projects. If space is limited, include more work experience items and fewer project items.
-4. Uses strong action words and quantifiable achievements (e.g., "Increased efficiency by 20%", "Managed a team of 5").
-5. Provide a concise professional summary (max 2-3 sentences) that highlights your unique value proposition.
-6. Provide exactly 2-3 concise bullet points for each work experience.
-7. Provide exactly 1-2 concise bullet points for each project.
-8. Ensure the layout is dense and professional to avoid empty space while strictly remaining on one page.
-9. Include a maximum of 3 professional work experiences and a maximum of 3 projects.
+                additional_parts.append(f"\n{category.upper()}:\n")
+                additional_parts.extend(
+                    "- "
+                    + (
+                        ", ".join(f"{k}: {v}" for k, v in item.items() if v)
+                        if isinstance(item, dict)
+                        else str(item)
+                    )
+                    + "\n"
+                    for item in items[:10]
+                )
+        additional_info = "".join(additional_parts)
+
+        github_projects = github_data.get("top_projects", [])
+        fields = dict(
+            job_description=job_requirements.get("original_description", "N/A"),
+            name=linkedin_data.get("name") or github_data.get("name", "N/A"),
+            headline=linkedin_data.get("headline", "N/A"),
+            bio=github_data.get("bio", "N/A"),
+            summary=linkedin_data.get("summary", "N/A"),
+            location=linkedin_data.get("location")
+            or github_data.get("location", "N/A"),
+            email=github_data.get("email", "N/A"),
+            experience=experience_text or "N/A",
+            education=education_text or "N/A",
+            skills=", ".join(all_candidate_skills),
+            github_projects=self._format_projects(github_projects),
+            linkedin_projects=li_projects_text or "N/A",
+            additional_info=additional_info or "N/A",
+            required_skills=_json_dumps_indented(job_requirements.get("skills", {})),
+        )
+        prompt = _PROMPT_TEMPLATE.substitute(fields)
+
+        # Stay within the token budget by shedding the lowest-priority
+        # sections first. The job description and skills are always kept.
+        budget = self.config.GEMINI_PROMPT_TOKEN_BUDGET
+        reductions = (
+            ("additional_info", lambda: "N/A"),
+            ("experience", lambda: self._format_experience(experiences[:3]) or "N/A"),
+            ("github_projects", lambda: self._format_projects(github_projects[:2])),
+            (
+                "linkedin_projects",
+                lambda: self._format_linkedin_projects(linkedin_projects[:1]) or "N/A",
+            ),
+        )
+        for section, reduce_section in reductions:
+            if _estimate_tokens(prompt) <= budget:
+                break
+            fields[section] = reduce_section()
+            prompt = _PROMPT_TEMPLATE.substitute(fields)
+
+        tokens = _estimate_tokens(prompt)
+        if tokens > budget:
+            logger.warning(f"Gemini prompt is ~{tokens} tokens, over budget of {budget}")
+        else:
+            logger.debug(f"Gemini prompt is ~{tokens} tokens")
+        return prompt
 
-Return the response in the following JSON format:
-{{
-    "summary": "Professional summary (2-3 sentences)",
-    "skills": ["skill1", "skill2", "skill3"],
-    "education": [
-        {{
-            "degree": "Degree Name",
-            "school": "School Name",
-            "date": "Graduation Date",
-            "details": "Minor or relevant coursework"
-        }}
-    ],
-    "experience": [
-        {{
-            "role": "Job Title",
-            "company": "Company Name",
-            "date": "Start - End",
-            "description": "Tailored bullet point highlighting relevance"
-        }}
-    ],
-    "projects": [
-        {{
-            "name": "Project Name",
-            "description": "Tailored description emphasizing project impact",
-            "technologies": ["tech1", "tech2"]
-        }}
-    ],
-    "certifications": ["Cert 1", "Cert 2"]
-}}
+    def _format_experience(self, experiences: List[Dict]) -> str:
+        """Format LinkedIn positions for prompt"""
+        return "".join(
+            f"- {exp.get('title')} at {exp.get('company')} ({exp.get('start_date')} - {exp.get('end_date')}): {exp.get('description')}\n"
+            for exp in experiences
+        )
 
-Only return valid JSON, no additional text."""
-        return prompt
+    def _format_linkedin_projects(self, projects: List[Dict]) -> str:
+        """Format LinkedIn projects for prompt"""
+        return "".join(
+            f"- {lp.get('title')}: {lp.get('description')} ({lp.get('start_date')} - {lp.get('end_date')})\n"
+            for lp in projects
+        )
 
     def _format_projects(self, projects: List[Dict]) -> str:
         """Format projects for prompt"""
@@ -233,17 +469,14 @@ Only return valid JSON, no additional text."""
 
         return "\n".join(formatted)
 
-    def _parse_gemini_response(self, response_text: str, profile_data: Dict) -> Dict:
-        """Parse Gemini's response into structured resume data"""
+    def _parse_gemini_response(
+        self, response_text: str, profile_data: Dict
+    ) -> Optional[Dict]:
+        """Parse Gemini's response into structured resume data (None if unparseable)"""
         try:
-            # Extract JSON from response (handle markdown code blocks)
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
-
-            if json_start >= 0 and json_end > json_start:
-                json_text = response_text[json_start:json_end]
-                parsed = json.loads(json_text)
+            parsed = _extract_json_object(response_text)
 
+            if isinstance(parsed, dict):
                 # Add profile information
                 github_data = profile_data.get("github", {})
                 linkedin_data = profile_data.get("linkedin", {})
@@ -267,8 +500,7 @@ Only return valid JSON, no additional text."""
         except Exception as e:
             print(f"Error parsing Gemini response: {e}")
 
-        # Fallback
-        return self._generate_basic_resume(profile_data, {})
+        return None
 
     def _generate_basic_resume(
         self, profile_data: Dict, job_requirements: Dict
@@ -285,20 +517,19 @@ Only return valid JSON, no additional text."""
 
         # Match skills with job requirements
         job_skills = job_requirements.get("skills", {})
-        job_skills_list = []
-        for category, skills in job_skills.items():
-            job_skills_list.extend(skills)
+        job_skill_set = frozenset(
+            js.lower() for skills in job_skills.values() for js in skills
+        )
 
         # Highlight matched skills
         highlighted_skills = [
-            s
-            for s in all_candidate_skills
-            if s.lower() in [js.lower() for js in job_skills_list]
+            s for s in all_candidate_skills if s.lower() in job_skill_set
         ]
+        highlighted_set = set(highlighted_skills)
         # Use a mix of matched skills and candidate's top tools
         final_skills = (
             highlighted_skills
-            + [s for s in all_candidate_skills if s not in highlighted_skills]
+            + [s for s in all_candidate_skills if s not in highlighted_set]
         )[:15]
 
         # Format experience
@@ -340,15 +571,10 @@ Only return valid JSON, no additional text."""
                 "details": edu.get("field_of_study", "")
             })
 
-        # Certifications and Languages from full_data
-        full_data = linkedin_data.get("full_data", {})
-        certifications = []
-        if "certifications" in full_data:
-            certifications = [c.get("name", "") for c in full_data.get("certifications", []) if c.get("name")]
-        
-        languages = []
-        if "languages" in full_data:
-            languages = [l.get("name", "") for l in full_data.get("languages", []) if l.get("name")]
+        # Certifications from the parsed LinkedIn export
+        certifications = [
+            c["name"] for c in linkedin_data.get("certifications", []) if c.get("name")
+        ]
 
         return {
             "name": linkedin_data.get("name") or github_data.get("name", "Your Name"),
@@ -10,9 +10,14 @@ Scrapes a user's GitHub profile to extract:
 """
 
 from github import Github
-from github.GithubException import GithubException
+from github.GithubException import GithubException, RateLimitExceededException
+from collections import Counter
+from functools import lru_cache
+import atexit
+import heapq
 import os
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional
 
 from database.repositories import CacheRepository
 from config import (
@@ -25,16 +30,42 @@ from config import (
 
 logger = get_logger(__name__)
 
+# Cached in place of a profile when the user doesn't exist
+NOT_FOUND_MARKER = "__notfound__"
+
+# Epoch seconds until which the API rate limit is known to be exhausted.
+# Limits apply per token, not per username, so this is process-wide.
+_rate_limited_until = 0.0
+
+
+def _rate_limit_reset(e: GithubException) -> Optional[int]:
+    """Extract X-RateLimit-Reset (epoch seconds) from a GitHub error, if present"""
+    for name, value in (e.headers or {}).items():
+        if name.lower() == "x-ratelimit-reset":
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_github_client(token: Optional[str]) -> Github:
+    """Shared GitHub client per token, so its connection pool is reused"""
+    client = Github(
+        token,
+        timeout=config.GITHUB_API_TIMEOUT,
+        pool_size=config.GITHUB_POOL_SIZE,
+    )
+    atexit.register(client.close)
+    return client
+
 
 class GitHubScraper:
     def __init__(self):
         """Initialize GitHub scraper with optional authentication"""
         token = os.getenv("GITHUB_TOKEN")
-        self.github = (
-            Github(token, timeout=config.GITHUB_API_TIMEOUT)
-            if token
-            else Github(timeout=config.GITHUB_API_TIMEOUT)
-        )
+        self.github = _get_github_client(token)
         logger.debug(
             f"GitHubScraper initialized with {'authenticated' if token else 'unauthenticated'} access"
         )
@@ -54,14 +85,22 @@ class GitHubScraper:
             GitHubRateLimitExceeded: If API rate limit exceeded
             GitHubAPIError: For other API errors
         """
+        global _rate_limited_until
+
         logger.info(f"Scraping GitHub profile for user: {username}")
 
         # Check cache first
         cached_data = CacheRepository.get_cached_github_profile(username)
         if cached_data:
+            if cached_data.get(NOT_FOUND_MARKER):
+                logger.info(f"Using cached not-found result for {username}")
+                raise GitHubUserNotFound(username)
             logger.info(f"Using cached GitHub data for {username}")
             return cached_data
 
+        if time.time() < _rate_limited_until:
+            raise GitHubRateLimitExceeded(int(_rate_limited_until))
+
         try:
             user = self.github.get_user(username)
 
@@ -97,11 +136,9 @@ class GitHubScraper:
                                 "stars": repo.stargazers_count,
                                 "forks": repo.forks_count,
                                 "url": repo.html_url,
-                                "topics": (
-                                    repo.get_topics()
-                                    if hasattr(repo, "get_topics")
-                                    else []
-                                ),
+                                # Already in the listing payload; get_topics()
+                                # would cost one extra request per repository
+                                "topics": list(repo.topics or []),
                             }
                         )
                 logger.debug(f"Fetched {len(repos)} repositories for {username}")
@@ -111,21 +148,14 @@ class GitHubScraper:
 
             profile_data["repositories"] = repos
 
-            # Aggregate languages
-            languages = {}
-            for repo in repos:
-                lang = repo.get("language", "")
-                if lang:
-                    languages[lang] = languages.get(lang, 0) + 1
-
-            profile_data["languages"] = sorted(
-                languages.items(), key=lambda x: x[1], reverse=True
-            )
+            # Aggregate languages, most used first
+            languages = Counter(repo["language"] for repo in repos if repo.get("language"))
+            profile_data["languages"] = languages.most_common()
 
             # Get top projects (by stars)
-            top_projects = sorted(repos, key=lambda x: x["stars"], reverse=True)[
-                : config.GITHUB_MAX_TOP_PROJECTS
-            ]
+            top_projects = heapq.nlargest(
+                config.GITHUB_MAX_TOP_PROJECTS, repos, key=lambda x: x["stars"]
+            )
             profile_data["top_projects"] = top_projects
 
             logger.info(f"Successfully scraped GitHub profile for {username}")
@@ -143,11 +173,27 @@ class GitHubScraper:
 
             # Check for specific error types
             if e.status == 404:
+                # Negative-cache so repeated lookups don't hit the API
+                try:
+                    CacheRepository.cache_github_profile(
+                        username,
+                        {NOT_FOUND_MARKER: True},
+                        ttl_hours=config.CACHE_TTL_GITHUB_NOT_FOUND / 3600,
+                    )
+                except Exception as cache_error:
+                    logger.warning(
+                        f"Failed to cache not-found result for {username}: {cache_error}"
+                    )
                 raise GitHubUserNotFound(username)
             elif e.status == 403:
                 # Check if it's a rate limit error
-                if "API rate limit exceeded" in str(e):
-                    raise GitHubRateLimitExceeded()
+                if isinstance(e, RateLimitExceededException) or (
+                    "API rate limit exceeded" in str(e)
+                ):
+                    reset_time = _rate_limit_reset(e)
+                    if reset_time:
+                        _rate_limited_until = reset_time
+                    raise GitHubRateLimitExceeded(reset_time)
                 raise GitHubAPIError(str(e), 403)
             else:
                 raise GitHubAPIError(str(e), e.status or 503)
@@ -176,45 +222,48 @@ class GitHubScraper:
             return []
 
         # Flatten all job skills into a single set for easy matching
-        all_required_skills = set()
-        for skills in job_skills.values():
-            if isinstance(skills, list):
-                all_required_skills.update([s.lower() for s in skills])
+        all_required_skills = frozenset(
+            s.lower()
+            for skills in job_skills.values()
+            if isinstance(skills, list)
+            for s in skills
+        )
 
         if not all_required_skills:
             # Fallback to stars if no skills identified
-            return sorted(repos, key=lambda x: x.get("stars", 0), reverse=True)[
-                : config.GITHUB_MAX_TOP_PROJECTS
-            ]
+            return heapq.nlargest(
+                config.GITHUB_MAX_TOP_PROJECTS, repos, key=lambda x: x.get("stars", 0)
+            )
 
         scored_repos = []
         for repo in repos:
             score = 0
-            repo_name = repo.get("name", "").lower()
-            repo_desc = (repo.get("description") or "").lower()
             repo_lang = (repo.get("language") or "").lower()
-            repo_topics = [t.lower() for t in repo.get("topics", [])]
 
             # Match language (High weight)
             if repo_lang in all_required_skills:
                 score += 5
 
             # Match topics (Medium weight)
-            for topic in repo_topics:
-                if topic in all_required_skills:
-                    score += 3
+            score += 3 * sum(
+                1 for t in repo.get("topics", []) if t.lower() in all_required_skills
+            )
 
-            # Match keywords in name/description (Low weight)
-            for skill in all_required_skills:
-                if skill in repo_name or skill in repo_desc:
-                    score += 1
+            # Match keywords in name/description (Low weight). The newline keeps
+            # a multi-word skill from matching across the name/description seam.
+            repo_text = (
+                f"{repo.get('name', '')}\n{repo.get('description') or ''}".lower()
+            )
+            score += sum(1 for skill in all_required_skills if skill in repo_text)
 
             scored_repos.append((score, repo))
 
-        # Sort by score (desc), then stars (desc) as tie-breaker
-        sorted_repos = sorted(
-            scored_repos, key=lambda x: (x[0], x[1].get("stars", 0)), reverse=True
+        # Top by score (desc), then stars (desc) as tie-breaker
+        top_repos = heapq.nlargest(
+            config.GITHUB_MAX_TOP_PROJECTS,
+            scored_repos,
+            key=lambda x: (x[0], x[1].get("stars", 0)),
         )
 
         # Return only the repository dictionaries
-        return [repo for score, repo in sorted_repos[: config.GITHUB_MAX_TOP_PROJECTS]]
+        return [repo for score, repo in top_repos]
@@ -10,11 +10,232 @@ In a production environment, you would:
 3. Use a third-party service with proper authorization
 """
 
-from typing import Dict, List, Optional
-import re
+from collections.abc import Mapping
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Union
 import zipfile
 import csv
+import hashlib
 import io
+import os
+from itertools import islice, repeat
+from operator import itemgetter
+
+from config import get_logger
+
+logger = get_logger(__name__)
+
+# LinkedIn export column -> record field, for each CSV we map into the profile
+_POSITION_COLUMNS = (
+    ("Title", "title"),
+    ("Company Name", "company"),
+    ("Location", "location"),
+    ("Started On", "start_date"),
+    ("Finished On", "end_date"),
+    ("Description", "description"),
+)
+_EDUCATION_COLUMNS = (
+    ("School Name", "school"),
+    ("Degree Name", "degree"),
+    ("Notes", "notes"),
+    ("Notes", "field_of_study"),  # Fallback
+    ("Started On", "start_date"),
+    ("Finished On", "end_date"),
+)
+_PROJECT_COLUMNS = (
+    ("Title", "title"),
+    ("Description", "description"),
+    ("URL", "url"),
+    ("Started On", "start_date"),
+    ("Finished On", "end_date"),
+)
+_CERTIFICATION_COLUMNS = (
+    ("Name", "name"),
+    ("Authority", "authority"),
+    ("License Number", "license_number"),
+    ("Url", "url"),
+    ("Started On", "start_date"),
+    ("Finished On", "end_date"),
+)
+_HONOR_COLUMNS = (
+    ("Title", "title"),
+    ("Issuer", "issuer"),
+    ("Issued On", "date"),
+    ("Description", "description"),
+)
+
+
+def _row_getter(header: List[str], columns: Iterable[str]):
+    """
+    itemgetter over the given columns of a CSV, and the row width it needs
+
+    Columns the export lacks point one past the header, at the "" padding
+    _padded adds to each row.
+    """
+    index = {column: i for i, column in enumerate(header)}
+    missing = len(header)
+    positions = [index.get(column, missing) for column in columns]
+    return itemgetter(*positions), max(positions) + 1
+
+
+def _padded(rows: Iterable[List[str]], width: int):
+    """Rows extended with empty fields to at least width columns"""
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        yield row
+
+
+def _records(
+    header: List[str], rows: Iterable[List[str]], columns, wanted=None
+) -> Iterator[Dict]:
+    """
+    Lazily select and rename the mapped columns of each CSV row
+
+    If wanted is given, fields outside it are left empty rather than read.
+    """
+    fields = [field for _, field in columns]
+    getter, width = _row_getter(
+        header,
+        [
+            column if wanted is None or field in wanted else None
+            for column, field in columns
+        ],
+    )
+    return map(dict, map(zip, repeat(fields), map(getter, _padded(rows, width))))
+
+
+def _mapped(target: str, columns):
+    """Handler that appends the mapped records of a CSV to profile_data[target]"""
+
+    def handler(header, rows, profile_data, fields=None):
+        wanted = fields.get(target) if fields else None
+        profile_data.setdefault(target, []).extend(
+            _records(header, rows, columns, wanted)
+        )
+
+    return handler
+
+
+def _parse_profile(header, rows, profile_data, fields=None):
+    """Name, headline and summary from the single Profile.csv row"""
+    row = next(iter(rows), None)
+    if row:
+        row = dict(zip(header, row))
+        profile_data[
+            "name"
+        ] = f"{row.get('First Name', '')} {row.get('Last Name', '')}".strip()
+        profile_data["headline"] = row.get("Headline", "")
+        profile_data["summary"] = row.get("Summary", "")
+
+
+def _parse_skills(header, rows, profile_data, fields=None):
+    """Skill names from Skills.csv"""
+    getter, width = _row_getter(header, ["Name"])
+    profile_data["skills"].extend(
+        name for name in map(getter, _padded(rows, width)) if name
+    )
+
+
+def _parse_languages(header, rows, profile_data, fields=None):
+    """Languages.csv rows as "Language (Proficiency)" strings"""
+    getter, width = _row_getter(header, ["Name", "Proficiency"])
+    profile_data.setdefault("languages", []).extend(
+        f"{lang} ({prof})" if prof else lang
+        for lang, prof in map(getter, _padded(rows, width))
+        if lang
+    )
+
+
+# Export file name -> handler(header, rows, profile_data, fields)
+_DISPATCH = {
+    "Profile.csv": _parse_profile,
+    "Positions.csv": _mapped("experience", _POSITION_COLUMNS),
+    "Education.csv": _mapped("education", _EDUCATION_COLUMNS),
+    "Skills.csv": _parse_skills,
+    "Projects.csv": _mapped("projects", _PROJECT_COLUMNS),
+    "Certifications.csv": _mapped("certifications", _CERTIFICATION_COLUMNS),
+    "Languages.csv": _parse_languages,
+    "Honors.csv": _mapped("awards", _HONOR_COLUMNS),
+}
+
+
+def _read_csv(data: bytes):
+    """Header and non-blank rows of a CSV member; header is None if empty"""
+    # utf-8-sig drops LinkedIn's BOM in the single decode call
+    reader = csv.reader(io.StringIO(data.decode("utf-8-sig"), newline=""))
+    header = next(reader, None)
+    # Blank lines come through as empty rows
+    return header, filter(None, reader)
+
+
+class _LazyCSVMap(Mapping):
+    """
+    full_data mapping of export key -> raw rows, parsed on first access
+
+    Exports carry many CSVs nothing reads (messages, shares, ...), so their
+    bytes are only decoded and tokenized if a caller asks for them. Each
+    sheet is held either as bytes or, once parsed, as rows, never both.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Union[bytes, List[Dict]]] = {}
+        # Hash of each sheet's raw bytes, kept once the bytes are parsed away
+        self._digests: Dict[str, bytes] = {}
+
+    def add(self, key: str, data: bytes) -> None:
+        self._data[key] = data
+        self._digests[key] = hashlib.blake2b(data, digest_size=16).digest()
+
+    def digest(self) -> str:
+        """Content hash of every sheet, without parsing any of them"""
+        h = hashlib.blake2b(digest_size=32)
+        for key in sorted(self._digests):
+            h.update(key.encode())
+            h.update(self._digests[key])
+        return h.hexdigest()
+
+    def __getitem__(self, key: str) -> List[Dict]:
+        data = self._data[key]
+        if not isinstance(data, bytes):
+            return data
+
+        rows = []
+        try:
+            header, reader = _read_csv(data)
+            if header is not None:
+                rows = [dict(zip(header, row)) for row in reader]
+        except Exception:
+            logger.exception("Error parsing %s", key)
+        self._data[key] = rows
+        return rows
+
+    def head(self, key: str, n: int) -> List[Dict]:
+        """
+        First n rows of a sheet, without parsing the rest of it
+
+        An unparsed sheet stays unparsed; only the rows returned are read.
+        """
+        data = self._data[key]
+        if not isinstance(data, bytes):
+            return data[:n]
+
+        try:
+            # Decode incrementally so a large sheet isn't decoded in full
+            text = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8-sig", newline="")
+            reader = csv.reader(text)
+            header = next(reader, None)
+            if header is None:
+                return []
+            return [dict(zip(header, row)) for row in islice(filter(None, reader), n)]
+        except Exception:
+            logger.exception("Error parsing %s", key)
+            return []
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class LinkedInScraper:
@@ -22,12 +243,21 @@ class LinkedInScraper:
         """Initialize LinkedIn scraper"""
         pass
 
-    def parse_export(self, zip_file_path: str) -> Dict:
+    def parse_export(
+        self,
+        zip_source: Union[str, os.PathLike, IO[bytes]],
+        *,
+        fields: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> Dict:
         """
         Parse LinkedIn data export ZIP file
 
         Args:
-            zip_file_path: Path to the LinkedIn data export ZIP file
+            zip_source: Path to the LinkedIn data export ZIP file, or a
+                seekable binary file object such as an upload stream
+            fields: Optional record fields to extract per section, e.g.
+                {"experience": ("title", "company")}. Other fields of those
+                records are left empty; unlisted sections are read in full.
 
         Returns:
             Dictionary containing profile data
@@ -40,134 +270,47 @@ class LinkedInScraper:
             "education": [],
             "skills": [],
             "source": "manual_export",
-            "full_data": {},  # Store all other CSV data here
+            "full_data": _LazyCSVMap(),  # Store all other CSV data here
         }
 
+        # Only opening the archive can fail as a whole; each member is read
+        # and parsed in isolation
         try:
-            with zipfile.ZipFile(zip_file_path, "r") as z:
-                for file_info in z.infolist():
-                    if not file_info.filename.endswith(".csv"):
-                        continue
-
-                    filename = file_info.filename
-
-                    # Skip connections as requested
-                    if "Connections.csv" in filename:
-                        continue
-
-                    with z.open(filename) as f:
-                        try:
-                            # Use utf-8-sig to handle potential BOM in LinkedIn exports
-                            content = io.TextIOWrapper(f, encoding="utf-8-sig")
-                            reader = csv.DictReader(content)
-                            rows = list(reader)
-
-                            # Standard assignments for known files
-                            if "Profile.csv" in filename and rows:
-                                row = rows[0]
-                                profile_data[
-                                    "name"
-                                ] = f"{row.get('First Name', '')} {row.get('Last Name', '')}".strip()
-                                profile_data["headline"] = row.get("Headline", "")
-                                profile_data["summary"] = row.get("Summary", "")
-
-                            elif "Positions.csv" in filename:
-                                for row in rows:
-                                    profile_data["experience"].append(
-                                        {
-                                            "title": row.get("Title", ""),
-                                            "company": row.get("Company Name", ""),
-                                            "location": row.get("Location", ""),
-                                            "start_date": row.get("Started On", ""),
-                                            "end_date": row.get("Finished On", ""),
-                                            "description": row.get("Description", ""),
-                                        }
-                                    )
-
-                            elif "Education.csv" in filename:
-                                for row in rows:
-                                    profile_data["education"].append(
-                                        {
-                                            "school": row.get("School Name", ""),
-                                            "degree": row.get("Degree Name", ""),
-                                            "notes": row.get("Notes", ""),
-                                            "field_of_study": row.get(
-                                                "Notes", ""
-                                            ),  # Fallback
-                                            "start_date": row.get("Started On", ""),
-                                            "end_date": row.get("Finished On", ""),
-                                        }
-                                    )
-
-                            elif "Skills.csv" in filename:
-                                for row in rows:
-                                    skill_name = row.get("Name", "")
-                                    if skill_name:
-                                        profile_data["skills"].append(skill_name)
-
-                            elif "Projects.csv" in filename:
-                                if "projects" not in profile_data:
-                                    profile_data["projects"] = []
-                                for row in rows:
-                                    profile_data["projects"].append(
-                                        {
-                                            "title": row.get("Title", ""),
-                                            "description": row.get("Description", ""),
-                                            "url": row.get("URL", ""),
-                                            "start_date": row.get("Started On", ""),
-                                            "end_date": row.get("Finished On", ""),
-                                        }
-                                    )
-
-                            elif "Certifications.csv" in filename:
-                                if "certifications" not in profile_data:
-                                    profile_data["certifications"] = []
-                                for row in rows:
-                                    profile_data["certifications"].append(
-                                        {
-                                            "name": row.get("Name", ""),
-                                            "authority": row.get("Authority", ""),
-                                            "license_number": row.get(
-                                                "License Number", ""
-                                            ),
-                                            "url": row.get("Url", ""),
-                                            "start_date": row.get("Started On", ""),
-                                            "end_date": row.get("Finished On", ""),
-                                        }
-                                    )
-
-                            elif "Languages.csv" in filename:
-                                if "languages" not in profile_data:
-                                    profile_data["languages"] = []
-                                for row in rows:
-                                    lang = row.get("Name", "")
-                                    prof = row.get("Proficiency", "")
-                                    if lang:
-                                        profile_data["languages"].append(
-                                            f"{lang} ({prof})" if prof else lang
-                                        )
-
-                            elif "Honors.csv" in filename:
-                                if "awards" not in profile_data:
-                                    profile_data["awards"] = []
-                                for row in rows:
-                                    profile_data["awards"].append(
-                                        {
-                                            "title": row.get("Title", ""),
-                                            "issuer": row.get("Issuer", ""),
-                                            "date": row.get("Issued On", ""),
-                                            "description": row.get("Description", ""),
-                                        }
-                                    )
-
-                            # Store everything else in full_data
-                            key = filename.replace(".csv", "").replace(" ", "_").lower()
-                            profile_data["full_data"][key] = rows
-
-                        except Exception as parse_error:
-                            print(f"Error parsing {filename}: {parse_error}")
-
-            return profile_data
-        except Exception as e:
-            print(f"Error parsing LinkedIn export: {e}")
+            z = zipfile.ZipFile(zip_source, "r")
+        except Exception:
+            logger.exception("Error opening LinkedIn export %s", zip_source)
             return profile_data
+
+        with z:
+            for file_info in z.infolist():
+                if not file_info.filename.endswith(".csv"):
+                    continue
+
+                filename = file_info.filename
+
+                # Skip connections as requested
+                if "Connections.csv" in filename:
+                    continue
+
+                # Exports are small enough to read whole
+                try:
+                    data = z.read(filename)
+                except Exception:
+                    logger.exception("Error reading %s", filename)
+                    continue
+
+                # Known files stream straight into the profile; the rest are
+                # kept raw in full_data until something reads them
+                handler = _DISPATCH.get(os.path.basename(filename))
+                if handler:
+                    try:
+                        header, rows = _read_csv(data)
+                        if header is not None:
+                            handler(header, rows, profile_data, fields)
+                    except Exception:
+                        logger.exception("Error parsing %s", filename)
+                else:
+                    key = filename.replace(".csv", "").replace(" ", "_").lower()
+                    profile_data["full_data"].add(key, data)
+
+        return profile_data
@@ -23,6 +23,8 @@ class TestInputValidator:
             "a",
             "user-name",
             "user123",
+            "a--b",
+            "a" * 39,
         ]
 
         for username in valid_usernames:
@@ -36,6 +38,8 @@ class TestInputValidator:
             "invalid-",
             "invalid user",
             "invalid@",
+            "usér",
+            "   ",
             "a" * 40,  # Too long
         ]
 
@@ -43,6 +47,18 @@ class TestInputValidator:
             with pytest.raises(InvalidGitHubUsername):
                 InputValidator.validate_github_username(username)
 
+    def test_cached_github_username_validation(self):
+        """Test repeated validations are served from cache and still raise"""
+        from utils.validators import _github_username_ok
+
+        InputValidator.cache_clear()
+        for _ in range(3):
+            assert InputValidator.validate_github_username("octocat") == "octocat"
+            with pytest.raises(InvalidGitHubUsername):
+                InputValidator.validate_github_username("-octocat")
+
+        assert _github_username_ok.cache_info().hits == 4
+
     def test_valid_job_description(self):
         """Test valid job description"""
         valid_desc = (
@@ -61,6 +77,17 @@ class TestInputValidator:
         with pytest.raises(InvalidJobDescription):
             InputValidator.validate_job_description(short_desc)
 
+    def test_validate_job_description_bytes(self):
+        """Test job descriptions given as UTF-8 bytes"""
+        desc = "Senior engineer for our Zürich team. " * 3
+        assert InputValidator.validate_job_description_bytes(
+            f"  {desc}  ".encode()
+        ) == desc.strip()
+
+        for raw in (b"", b"too short", b"\xff" * 100, b"x" * 200001):
+            with pytest.raises(InvalidJobDescription):
+                InputValidator.validate_job_description_bytes(raw)
+
     def test_job_description_cleanup(self):
         """Test job description cleanup"""
         desc = "  Job description with spaces and enough characters to meet minimum requirement  "
@@ -82,10 +109,34 @@ class TestInputValidator:
         assert result_github == github
         assert result_job == job_desc
 
+    def test_validate_batch(self):
+        """Test batch validation flags each request without raising"""
+        job = "Looking for a Python developer with 3+ years experience. " * 2
+
+        result = InputValidator.validate_batch(
+            ["octocat", "-bad", "", "octocat"], [job, job, job, "too short"]
+        )
+
+        assert result == [True, False, True, False]
+
 
 class TestGitHubScraper:
     """Tests for GitHub scraper"""
 
+    @pytest.fixture(autouse=True)
+    def fresh_github_client(self):
+        """Each test patches Github, so don't reuse a client cached by another"""
+        from scrapers.github_scraper import _get_github_client
+
+        _get_github_client.cache_clear()
+        yield
+        _get_github_client.cache_clear()
+
+    @pytest.fixture(autouse=True)
+    def no_rate_limit(self, monkeypatch):
+        """Don't let a rate-limit reset recorded by one test block the next"""
+        monkeypatch.setattr("scrapers.github_scraper._rate_limited_until", 0.0)
+
     @patch("scrapers.github_scraper.Github")
     @patch("scrapers.github_scraper.CacheRepository")
     def test_scrape_profile_success(self, mock_cache, mock_github_class):
@@ -117,7 +168,7 @@ class TestGitHubScraper:
         mock_repo.stargazers_count = 100000
         mock_repo.forks_count = 50000
         mock_repo.html_url = "https://github.com/torvalds/linux"
-        mock_repo.get_topics = Mock(return_value=["kernel", "os"])
+        mock_repo.topics = ["kernel", "os"]
 
         mock_user.get_repos = Mock(return_value=[mock_repo])
 
@@ -135,6 +186,7 @@ class TestGitHubScraper:
         assert len(result["repositories"]) == 1
         assert result["repositories"][0]["name"] == "linux"
         assert result["languages"] == [("C", 1)]
+        assert result["repositories"][0]["topics"] == ["kernel", "os"]
 
     @patch("scrapers.github_scraper.Github")
     @patch("scrapers.github_scraper.CacheRepository")
@@ -159,6 +211,178 @@ class TestGitHubScraper:
         with pytest.raises(GitHubUserNotFound):
             scraper.scrape_profile("nonexistentuser123456789")
 
+        # The miss is negative-cached
+        cached_username, cached_data = mock_cache.cache_github_profile.call_args[0]
+        assert cached_username == "nonexistentuser123456789"
+        assert cached_data == {"__notfound__": True}
+
+    @patch("scrapers.github_scraper.Github")
+    @patch("scrapers.github_scraper.CacheRepository")
+    def test_rate_limit_fails_fast_until_reset(self, mock_cache, mock_github_class):
+        """Test a rate-limited call blocks API calls until X-RateLimit-Reset"""
+        import time
+        from scrapers.github_scraper import GitHubScraper
+        from github.GithubException import RateLimitExceededException
+        from config import GitHubRateLimitExceeded
+
+        mock_cache.get_cached_github_profile.return_value = None
+        reset_time = int(time.time()) + 3600
+
+        mock_github_instance = Mock()
+        mock_github_instance.get_user = Mock(
+            side_effect=RateLimitExceededException(
+                403,
+                {"message": "API rate limit exceeded"},
+                {"X-RateLimit-Reset": str(reset_time)},
+            )
+        )
+        mock_github_class.return_value = mock_github_instance
+
+        scraper = GitHubScraper()
+        for _ in range(2):
+            with pytest.raises(GitHubRateLimitExceeded) as exc_info:
+                scraper.scrape_profile("octocat")
+            assert str(reset_time) in str(exc_info.value)
+
+        # The second call failed fast without reaching the API
+        assert mock_github_instance.get_user.call_count == 1
+
+    @patch("scrapers.github_scraper.Github")
+    @patch("scrapers.github_scraper.CacheRepository")
+    def test_scrape_cached_nonexistent_user(self, mock_cache, mock_github_class):
+        """Test a negative-cached user is rejected without calling the API"""
+        from scrapers.github_scraper import GitHubScraper
+        from config import GitHubUserNotFound
+
+        mock_cache.get_cached_github_profile.return_value = {"__notfound__": True}
+
+        with pytest.raises(GitHubUserNotFound):
+            GitHubScraper().scrape_profile("ghost")
+
+        mock_github_class.return_value.get_user.assert_not_called()
+
+    @patch("scrapers.github_scraper.Github")
+    def test_select_relevant_projects(self, mock_github_class):
+        """Test projects are ranked by job skill relevance, then stars"""
+        from scrapers.github_scraper import GitHubScraper
+
+        repos = [
+            {"name": "popular", "description": "", "language": "C", "stars": 500, "topics": []},
+            {"name": "api", "description": "A Django REST service", "language": "Python", "stars": 5, "topics": ["docker"]},
+            {"name": "django-blog", "description": "Blog", "language": "Python", "stars": 1, "topics": []},
+        ]
+        job_skills = {"languages": ["python"], "frameworks": ["django"], "tools": ["Docker"]}
+
+        result = GitHubScraper().select_relevant_projects(repos, job_skills)
+
+        assert [r["name"] for r in result] == ["api", "django-blog", "popular"]
+
+
+def _linkedin_export(path):
+    """Write a small LinkedIn data export ZIP to path"""
+    import zipfile
+
+    files = {
+        "Profile.csv": "First Name,Last Name,Headline,Summary\nAda,Lovelace,Engineer,Writes programs\n",
+        "Positions.csv": (
+            "Company Name,Title,Description,Location,Started On,Finished On\n"
+            "Analytical Engines,Programmer,\"Wrote the first, famous, program\",London,Jan 1842,Dec 1843\n"
+            "Babbage & Co,Assistant,,,1840\n"  # Short row
+        ),
+        "Education.csv": "School Name,Start Date,Degree Name,Notes,Started On,Finished On\nHome,,Mathematics,Tutored,1830,1835\n",
+        "Skills.csv": "Name\nMathematics\n\nPoetry\n",
+        "Projects.csv": "Title,Description,URL,Started On,Finished On\nNotes on the Engine,Translation,,1842,1843\n",
+        "Certifications.csv": "Name,Url,Authority,Started On,Finished On,License Number\nFRS,,Royal Society,1840,,42\n",
+        "Languages.csv": "Name,Proficiency\nEnglish,Native\nFrench,\n",
+        "Honors.csv": "Title,Description,Issued On,Issuer\nHonorary,For notes,1843,Society\n",
+        "Connections.csv": "First Name,Last Name\nCharles,Babbage\n",
+        "Email Addresses.csv": "Email Address,Confirmed\nada@example.com,Yes\n",
+    }
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, content in files.items():
+            # LinkedIn exports are UTF-8 with a BOM
+            z.writestr(name, "\ufeff" + content)
+    return path
+
+
+class TestLinkedInScraper:
+    """Tests for LinkedIn data export parsing"""
+
+    def test_parse_export(self, tmp_path):
+        """Test known CSVs are mapped into the profile"""
+        from scrapers.linkedin_scraper import LinkedInScraper
+
+        export = _linkedin_export(tmp_path / "export.zip")
+        result = LinkedInScraper().parse_export(str(export))
+
+        assert result["name"] == "Ada Lovelace"
+        assert result["headline"] == "Engineer"
+        assert result["summary"] == "Writes programs"
+        assert [e["title"] for e in result["experience"]] == ["Programmer", "Assistant"]
+        assert result["experience"][0]["company"] == "Analytical Engines"
+        assert result["experience"][0]["description"] == "Wrote the first, famous, program"
+        assert result["experience"][1]["end_date"] == ""
+        assert result["education"][0]["school"] == "Home"
+        assert result["education"][0]["field_of_study"] == "Tutored"
+        assert result["skills"] == ["Mathematics", "Poetry"]
+        assert result["projects"][0]["title"] == "Notes on the Engine"
+        assert result["certifications"][0]["name"] == "FRS"
+        assert result["certifications"][0]["license_number"] == "42"
+        assert result["languages"] == ["English (Native)", "French"]
+        assert result["awards"][0]["issuer"] == "Society"
+
+        # Only unmapped CSVs are kept as raw rows, parsed on first access;
+        # connections are skipped
+        assert set(result["full_data"]) == {"email_addresses"}
+        assert result["full_data"].head("email_addresses", 10) == [
+            {"Email Address": "ada@example.com", "Confirmed": "Yes"}
+        ]
+        assert result["full_data"]["email_addresses"] == [
+            {"Email Address": "ada@example.com", "Confirmed": "Yes"}
+        ]
+        assert "connections" not in result["full_data"]
+
+    def test_parse_export_from_stream(self, tmp_path):
+        """Test an export can be parsed from a file object, as uploaded"""
+        import io
+        from scrapers.linkedin_scraper import LinkedInScraper
+
+        export = _linkedin_export(tmp_path / "export.zip")
+        stream = io.BytesIO(export.read_bytes())
+
+        result = LinkedInScraper().parse_export(stream)
+
+        assert result == LinkedInScraper().parse_export(str(export))
+        assert result["name"] == "Ada Lovelace"
+
+    def test_parse_export_selected_fields(self, tmp_path):
+        """Test only the requested fields of a section are extracted"""
+        from scrapers.linkedin_scraper import LinkedInScraper
+
+        export = str(_linkedin_export(tmp_path / "export.zip"))
+
+        result = LinkedInScraper().parse_export(
+            export, fields={"experience": ("title", "company")}
+        )
+
+        first = result["experience"][0]
+        assert (first["title"], first["company"]) == ("Programmer", "Analytical Engines")
+        assert first["location"] == first["description"] == ""
+        # Sections that weren't listed are read in full
+        assert result["education"][0]["field_of_study"] == "Tutored"
+
+    def test_parse_export_invalid_zip(self, tmp_path):
+        """Test an unreadable archive yields an empty profile"""
+        from scrapers.linkedin_scraper import LinkedInScraper
+
+        bad = tmp_path / "export.zip"
+        bad.write_bytes(b"not a zip")
+
+        result = LinkedInScraper().parse_export(str(bad))
+
+        assert result["experience"] == []
+        assert result["full_data"] == {}
+
 
 class TestJobAnalyzer:
     """Tests for job analyzer"""
@@ -205,6 +429,179 @@ class TestJobAnalyzer:
         assert "5" in experience
 
 
+class TestResumeGenerator:
+    """Tests for resume generator"""
+
+    def test_cache_key_ignores_ordering_and_volatile_fields(self):
+        """Logically-equivalent inputs share a resume cache key"""
+        from generator.resume_generator import _resume_cache_key
+
+        profile_a = {
+            "github": {
+                "username": "octocat",
+                "bio": "Builds   things\n",
+                "languages": [("Python", 3), ("Go", 1)],
+                "followers": 10,
+            },
+            "linkedin": {"skills": ["SQL", "Docker"]},
+        }
+        profile_b = {
+            "linkedin": {"skills": ["Docker", "SQL"]},
+            "github": {
+                "followers": 99,
+                "languages": [("Go", 1), ("Python", 3)],
+                "bio": "Builds things",
+                "username": "octocat",
+            },
+        }
+        job = {"original_description": "Python role", "skills": {"languages": ["python"]}}
+
+        key = _resume_cache_key(profile_a, job, "gemini")
+        assert key == _resume_cache_key(profile_b, job, "gemini")
+        assert key != _resume_cache_key(profile_b, job, "gemini-pro")
+
+        profile_b["github"]["username"] = "someone-else"
+        assert key != _resume_cache_key(profile_b, job, "gemini")
+
+    def test_generate_skips_gemini_without_job_description(self):
+        """An empty job description goes straight to the basic resume"""
+        from generator.resume_generator import ResumeGenerator
+
+        generator = ResumeGenerator.__new__(ResumeGenerator)
+        generator.client = Mock()
+        profile = {
+            "github": {"username": "octocat", "name": "Octo", "languages": []},
+            "linkedin": {"certifications": [{"name": "CKA"}, {"name": ""}]},
+        }
+
+        result = generator.generate(profile, {"skills": {}})
+
+        generator.client.models.generate_content.assert_not_called()
+        assert result["name"] == "Octo"
+        assert result["certifications"] == ["CKA"]
+
+    def test_generate_reads_and_fills_resume_cache(self):
+        """A cache hit skips Gemini; a fresh resume is written back"""
+        from generator.resume_generator import ResumeGenerator
+
+        generator = ResumeGenerator.__new__(ResumeGenerator)
+        generator.client = Mock()
+        generator.model_name = "gemini"
+        generator.config = Mock(
+            CACHE_ENABLED=True,
+            CACHE_TTL_RESUME=7200,
+            GEMINI_PROMPT_TOKEN_BUDGET=100000,
+        )
+        profile = {"github": {"username": "octocat", "name": "Octo"}}
+        job = {"original_description": "Backend engineer role", "skills": {}}
+
+        with patch("generator.resume_generator.CacheRepository") as cache:
+            cache.get_cached_resume.return_value = {"summary": "cached"}
+            assert generator.generate(profile, job) == {"summary": "cached"}
+            generator.client.models.generate_content.assert_not_called()
+            cache.cache_resume.assert_not_called()
+
+            cache.get_cached_resume.return_value = None
+            generator.client.models.generate_content.return_value = Mock(
+                text='{"summary": "fresh"}'
+            )
+            result = generator.generate(profile, job)
+
+        assert result["summary"] == "fresh"
+        key = cache.get_cached_resume.call_args[0][0]
+        cache.cache_resume.assert_called_once_with(key, result, ttl_hours=2)
+
+    def test_parse_gemini_response_with_fences_and_trailing_text(self):
+        """JSON wrapped in code fences or followed by commentary still parses"""
+        from generator.resume_generator import ResumeGenerator
+
+        generator = ResumeGenerator.__new__(ResumeGenerator)
+        profile = {"github": {"username": "octocat", "name": "Octo"}}
+        response = (
+            "```json\n"
+            '{"summary": "Uses {braces} in text", "skills": ["Python"]}\n'
+            "```\n"
+            "Let me know if you want changes to the {layout}."
+        )
+
+        parsed = generator._parse_gemini_response(response, profile)
+
+        assert parsed["summary"] == "Uses {braces} in text"
+        assert parsed["github_url"] == "github.com/octocat"
+        assert generator._parse_gemini_response("no json here", profile) is None
+
+    def test_prompt_drops_low_priority_sections_over_budget(self):
+        """Over-budget prompts shed LinkedIn archive extras but keep the job"""
+        from generator.resume_generator import ResumeGenerator
+
+        generator = ResumeGenerator.__new__(ResumeGenerator)
+        profile = {
+            "linkedin": {
+                "awards": [{"title": "Award " + "x" * 200}] * 10,
+            }
+        }
+        job = {"original_description": "Backend engineer role", "skills": {}}
+
+        generator.config = Mock(GEMINI_PROMPT_TOKEN_BUDGET=100000)
+        assert "HONORS:" in generator._create_prompt(profile, job)
+
+        generator.config = Mock(GEMINI_PROMPT_TOKEN_BUDGET=500)
+        prompt = generator._create_prompt(profile, job)
+        assert "HONORS:" not in prompt
+        assert "Backend engineer role" in prompt
+
+    def test_prompt_and_cache_key_read_only_head_of_full_data(self):
+        """Unmapped export sheets are never parsed in full for a generate()"""
+        from generator.resume_generator import ResumeGenerator, _resume_cache_key
+        from scrapers.linkedin_scraper import _LazyCSVMap
+
+        full_data = _LazyCSVMap()
+        full_data.add(
+            "shares",
+            ("Date,Commentary\n" + "".join(f"2024,post-{i}\n" for i in range(100))).encode(),
+        )
+        full_data.add("connections", b"First Name\nCharles\n")
+        profile = {"linkedin": {"full_data": full_data}}
+        job = {"original_description": "Backend engineer role", "skills": {}}
+
+        generator = ResumeGenerator.__new__(ResumeGenerator)
+        generator.config = Mock(GEMINI_PROMPT_TOKEN_BUDGET=100000)
+        with patch.object(_LazyCSVMap, "__getitem__", side_effect=AssertionError):
+            prompt = generator._create_prompt(profile, job)
+            _resume_cache_key(profile, job, "gemini")
+
+        assert "SHARES:" in prompt
+        assert "post-9\n" in prompt and "post-10\n" not in prompt
+        assert "CONNECTIONS:" not in prompt
+
+    def test_cache_key_covers_unmapped_export_sheets(self, tmp_path):
+        """Exports differing only in an unmapped sheet get different keys"""
+        import zipfile
+        from generator.resume_generator import _resume_cache_key
+        from scrapers.linkedin_scraper import LinkedInScraper, _LazyCSVMap
+
+        def export(name, email):
+            path = tmp_path / name
+            with zipfile.ZipFile(path, "w") as z:
+                z.writestr("Profile.csv", "First Name,Last Name\nAda,Lovelace\n")
+                z.writestr("Email Addresses.csv", f"Email Address\n{email}\n")
+            return {"linkedin": LinkedInScraper().parse_export(path)}
+
+        job = {"original_description": "Backend engineer role", "skills": {}}
+        profile_a = export("a.zip", "ada@example.com")
+        profile_b = export("b.zip", "ada@example.org")
+
+        with patch.object(_LazyCSVMap, "__getitem__", side_effect=AssertionError):
+            key_a = _resume_cache_key(profile_a, job, "gemini")
+            assert key_a != _resume_cache_key(profile_b, job, "gemini")
+            profile_c = export("c.zip", "ada@example.com")
+            assert key_a == _resume_cache_key(profile_c, job, "gemini")
+
+        # Reading a sheet doesn't change the key
+        profile_a["linkedin"]["full_data"]["email_addresses"]
+        assert _resume_cache_key(profile_a, job, "gemini") == key_a
+
+
 class TestConfiguration:
     """Tests for configuration management"""
 
@@ -331,31 +728,37 @@ class TestFlaskApp:
 class TestPerformance:
     """Performance tests"""
 
+    @staticmethod
+    def _best_ns(fn, iterations, runs=5):
+        """Fastest of several timed runs, in nanoseconds, to filter out jitter"""
+        from time import perf_counter_ns
+
+        best = None
+        for _ in range(runs):
+            start = perf_counter_ns()
+            for _ in range(iterations):
+                fn()
+            duration = perf_counter_ns() - start
+            best = duration if best is None else min(best, duration)
+        return best
+
     def test_validator_performance(self):
         """Test validator performance"""
-        import time
-
-        start = time.time()
-        for _ in range(1000):
-            InputValidator.validate_github_username("test-user")
-        duration = time.time() - start
+        duration = self._best_ns(
+            lambda: InputValidator.validate_github_username("test-user"), 1000
+        )
 
         # Should complete 1000 validations in less than 1 second
-        assert duration < 1.0
+        assert duration < 1_000_000_000
 
     def test_config_loading_performance(self):
         """Test configuration loading performance"""
-        import time
-
-        start = time.time()
         from config import get_config
 
-        for _ in range(100):
-            config = get_config()
-        duration = time.time() - start
+        duration = self._best_ns(get_config, 100)
 
         # Should load config 100 times in less than 1 second
-        assert duration < 1.0
+        assert duration < 1_000_000_000
 
 
 if __name__ == "__main__":
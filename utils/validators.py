@@ -4,26 +4,57 @@ Input validation utilities for LLMployable
 Provides validation functions for all user inputs before processing.
 """
 
-import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Final, Iterable, List, Optional, Tuple
 from config.exceptions import (
     InvalidGitHubUsername,
     InvalidJobDescription,
 )
 
+# Bounds are module globals so the validators read them without a class
+# attribute lookup; InputValidator keeps its public names for callers
+
+# GitHub username: ASCII alphanumerics and hyphens only, not starting or
+# ending with a hyphen, 1-39 chars
+_MAX_USERNAME: Final = 39
+
+# Job description: minimum 50 chars, maximum 50000 chars
+_MIN_JOB_DESC: Final = 50
+_MAX_JOB_DESC: Final = 50000
+
+# Job description rejection messages, formatted once from the bounds above
+_MIN_MSG: Final = f"Job description must be at least {_MIN_JOB_DESC} characters"
+_MAX_MSG: Final = f"Job description must not exceed {_MAX_JOB_DESC} characters"
+
+
+@lru_cache(maxsize=4096)
+def _github_username_ok(username: str) -> bool:
+    """
+    Format check for a stripped GitHub username
+
+    Cached because the same handful of usernames is validated over and
+    over across retries and repeat requests.
+    """
+    return (
+        0 < len(username) <= _MAX_USERNAME
+        and username[0] != "-"
+        and username[-1] != "-"
+        # str methods run the character-class check in C without the regex
+        # engine; isascii() keeps non-ASCII letters out of isalnum()
+        and username.isascii()
+        and username.replace("-", "").isalnum()
+    )
+
 
 class InputValidator:
     """Validates user input before processing"""
 
-    # GitHub username pattern: alphanumeric and hyphens only, 1-39 chars
-    GITHUB_USERNAME_PATTERN = r"^[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,37}[a-zA-Z0-9])?$"
-
-    # Job description: minimum 50 chars, maximum 50000 chars
-    MIN_JOB_DESC_LENGTH = 50
-    MAX_JOB_DESC_LENGTH = 50000
+    MAX_GITHUB_USERNAME_LENGTH: Final = _MAX_USERNAME
+    MIN_JOB_DESC_LENGTH: Final = _MIN_JOB_DESC
+    MAX_JOB_DESC_LENGTH: Final = _MAX_JOB_DESC
 
-    @classmethod
-    def validate_github_username(cls, username: str) -> str:
+    @staticmethod
+    def validate_github_username(username: str) -> str:
         """
         Validate GitHub username format
 
@@ -41,16 +72,21 @@ class InputValidator:
 
         username = username.strip()
 
-        if not re.match(cls.GITHUB_USERNAME_PATTERN, username):
-            raise InvalidGitHubUsername(username)
-
-        if len(username) > 39:
+        if not InputValidator._username_ok(username):
             raise InvalidGitHubUsername(username)
 
         return username
 
-    @classmethod
-    def validate_job_description(cls, job_desc: str) -> str:
+    @staticmethod
+    def _username_ok(username: str) -> bool:
+        """Format check for a stripped username, without raising"""
+        # Over-long input is rejected before the cache so it is never retained
+        if len(username) > _MAX_USERNAME:
+            return False
+        return _github_username_ok(username)
+
+    @staticmethod
+    def validate_job_description(job_desc: str) -> str:
         """
         Validate job description
 
@@ -67,23 +103,52 @@ class InputValidator:
             raise InvalidJobDescription("Job description cannot be empty")
 
         job_desc = job_desc.strip()
+        error = InputValidator._job_description_error(job_desc)
+        if error is not None:
+            raise InvalidJobDescription(error)
 
-        if len(job_desc) < cls.MIN_JOB_DESC_LENGTH:
-            raise InvalidJobDescription(
-                f"Job description must be at least {cls.MIN_JOB_DESC_LENGTH} characters"
-            )
+        return job_desc
 
-        if len(job_desc) > cls.MAX_JOB_DESC_LENGTH:
-            raise InvalidJobDescription(
-                f"Job description must not exceed {cls.MAX_JOB_DESC_LENGTH} characters"
-            )
+    @staticmethod
+    def validate_job_description_bytes(raw: bytes) -> str:
+        """
+        Validate a job description received as UTF-8 bytes
 
-        return job_desc
+        Args:
+            raw: UTF-8 encoded job description
+
+        Returns:
+            Cleaned job description
+
+        Raises:
+            InvalidJobDescription: If job description is invalid
+        """
+        # A UTF-8 character is at most 4 bytes, so anything longer cannot fit
+        # and is rejected without decoding it
+        if len(raw) > _MAX_JOB_DESC * 4:
+            raise InvalidJobDescription(_MAX_MSG)
 
-    @classmethod
-    def validate_request(
-        cls, github_username: str, job_description: str
-    ) -> Tuple[str, str]:
+        try:
+            job_desc = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            raise InvalidJobDescription(
+                "Job description must be valid UTF-8 text"
+            ) from None
+
+        return InputValidator.validate_job_description(job_desc)
+
+    @staticmethod
+    def _job_description_error(job_desc: str) -> Optional[str]:
+        """Error message for an invalid stripped job description, or None"""
+        length = len(job_desc)
+        if length < _MIN_JOB_DESC:
+            return _MIN_MSG
+        if length > _MAX_JOB_DESC:
+            return _MAX_MSG
+        return None
+
+    @staticmethod
+    def validate_request(github_username: str, job_description: str) -> Tuple[str, str]:
         """
         Validate complete request input
 
@@ -98,25 +163,62 @@ class InputValidator:
             InvalidGitHubUsername: If username is invalid
             InvalidJobDescription: If job description is invalid
         """
-        github_username = cls.validate_github_username(github_username)
-        job_description = cls.validate_job_description(job_description)
+        # Calls the rule helpers directly rather than the validate_* methods,
+        # so the rules stay in one place without the extra method hops
+        if github_username:
+            github_username = github_username.strip()
+            if not InputValidator._username_ok(github_username):
+                raise InvalidGitHubUsername(github_username)
+        else:
+            github_username = ""
+
+        if not job_description:
+            raise InvalidJobDescription("Job description cannot be empty")
+
+        job_description = job_description.strip()
+        error = InputValidator._job_description_error(job_description)
+        if error is not None:
+            raise InvalidJobDescription(error)
 
         return github_username, job_description
 
-    @classmethod
-    def is_valid_github_username(cls, username: str) -> bool:
+    @staticmethod
+    def validate_batch(
+        usernames: Iterable[str], job_descriptions: Iterable[str]
+    ) -> List[bool]:
+        """
+        Validate many requests at once, e.g. for bulk candidate imports
+
+        Args:
+            usernames: GitHub usernames, one per request
+            job_descriptions: Job descriptions, aligned with usernames
+
+        Returns:
+            One flag per request, True where validate_request would accept it
+        """
+        is_valid_username = InputValidator.is_valid_github_username
+        is_valid_job_desc = InputValidator.is_valid_job_description
+        return [
+            is_valid_username(username) and is_valid_job_desc(job_desc)
+            for username, job_desc in zip(usernames, job_descriptions, strict=True)
+        ]
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop memoized validation results (e.g. between tests)"""
+        _github_username_ok.cache_clear()
+
+    @staticmethod
+    def is_valid_github_username(username: str) -> bool:
         """Check if username is valid without raising exception"""
-        try:
-            cls.validate_github_username(username)
-            return True
-        except InvalidGitHubUsername:
-            return False
+        # An empty username is allowed, as in validate_github_username
+        return not username or InputValidator._username_ok(username.strip())
 
-    @classmethod
-    def is_valid_job_description(cls, job_desc: str) -> bool:
+    @staticmethod
+    def is_valid_job_description(job_desc: str) -> bool:
         """Check if job description is valid without raising exception"""
-        try:
-            cls.validate_job_description(job_desc)
-            return True
-        except InvalidJobDescription:
-            return False
+        return (
+            bool(job_desc)
+            and InputValidator._job_description_error(job_desc.strip()) is None
+        )
+